@@ -19,6 +19,7 @@
 """Provide time related exceptions and functions"""
 
 import calendar
+import functools
 import re
 import time
 from rdiffbackup.singletons import generics
@@ -122,7 +123,14 @@ def stringtotime(timestring):
         return None
 
 
+@functools.lru_cache(maxsize=1024)
 def bytestotime(timebytes):
+    """
+    Return time in seconds from w3 timestring given as bytes, or None
+
+    Results are cached because the same few time strings are parsed for
+    each and every increment file of the repository.
+    """
     try:
         return stringtotime(timebytes.decode("ascii"))
     except UnicodeDecodeError:
@@ -74,7 +74,7 @@ class Logger:
 
         message can be a string or bytes
         """
-        if verbosity > self.file_verbosity and verbosity > self.term_verbosity:
+        if not self.is_logged(verbosity):
             return
 
         if not isinstance(message, (bytes, str)):
@@ -87,6 +87,14 @@ class Logger:
         if verbosity <= self.term_verbosity:
             self.log_to_term(message, verbosity)
 
+    def is_logged(self, verbosity):
+        """
+        Return True if a message of the given verbosity would be logged
+
+        Useful to avoid building costly messages which would be dropped.
+        """
+        return verbosity <= self.file_verbosity or verbosity <= self.term_verbosity
+
     # @API(Log.log_to_file, 200)
     def log_to_file(self, message, verbosity=None):
         """Write the message to the log file, if possible"""
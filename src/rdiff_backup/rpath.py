@@ -970,7 +970,7 @@ class RPath(RORPath):
                 else:
                     raise
 
-        self.setdata()
+        self.data = {"type": None}  # no need to stat what was just deleted
 
     def contains_files(self):
         """Returns true if self (or subdir) contains any regular files."""
@@ -1028,15 +1028,18 @@ class RPath(RORPath):
         comps = normed.path.split(b"/")
         return b"/".join(comps[:-1]), comps[-1]
 
-    def get_parent_rp(self):
-        """Return new RPath of directory self is in"""
+    def get_parent_rp(self, data=None):
+        """Return new RPath of directory self is in
+
+        If data is given, it is used instead of stat'ing the directory.
+        """
         if self.index:
-            return self.__class__(self.conn, self.base, self.index[:-1])
+            return self.__class__(self.conn, self.base, self.index[:-1], data)
         dirname = self.dirsplit()[0]
         if dirname:
-            return self.__class__(self.conn, dirname)
+            return self.__class__(self.conn, dirname, (), data)
         else:
-            return self.__class__(self.conn, b"/")
+            return self.__class__(self.conn, b"/", (), data)
 
     def get_incfiles_list(self):
         """
@@ -1089,7 +1092,14 @@ class RPath(RORPath):
 
         # recursion if current rpath isn't a directory or if explicitly asked
         if sibling or not self.isdir():
-            return self.get_parent_rp().get_temp_rpath()
+            # only the type of the parent matters, not all its metadata
+            parent_rp = self.get_parent_rp({"type": None})
+            try:
+                if stat.S_ISDIR(os.lstat(parent_rp.path).st_mode):
+                    parent_rp.data["type"] = "dir"
+            except OSError:
+                pass  # then the parent's parent is tried
+            return parent_rp.get_temp_rpath()
 
         # When the file system hosting the rdiff-backup-data directory
         # is (almost) full and when the --tempdir flag is defined,
@@ -1291,9 +1301,12 @@ class RPath(RORPath):
 
     def fsync_with_dir(self, fp=None):
         """fsync self and directory self is under"""
+        if not generics.do_fsync:
+            return  # don't create (and stat) the parent rpath for nothing
         self.fsync(fp)
         if generics.fsync_directories:
-            self.get_parent_rp().fsync()
+            # only the path of the parent directory is needed, no need to stat
+            self.get_parent_rp({"type": "dir"}).fsync()
 
     def get_bytes(self, compressed=None):
         """Open file as a regular file, read data, close, return data"""
@@ -1561,10 +1574,13 @@ def copy(rpin, rpout, compress=0):
     Returns close value of input for regular file, which can be used
     to pass hashes on.
     """
-    log.Log(
-        "Regular copying input path {ip} to output path {op}".format(ip=rpin, op=rpout),
-        log.DEBUG,
-    )
+    if log.Log.is_logged(log.DEBUG):
+        log.Log(
+            "Regular copying input path {ip} to output path {op}".format(
+                ip=rpin, op=rpout
+            ),
+            log.DEBUG,
+        )
     if not rpin.lstat():
         if rpout.lstat():
             rpout.delete()
@@ -1661,10 +1677,13 @@ def copy_attribs(rpin, rpout):
     Only changes the chmoddable bits, uid/gid ownership, and
     timestamps, so both must already exist.
     """
-    log.Log(
-        "Copying attributes from path {fp!r} to path {tp!r}".format(fp=rpin, tp=rpout),
-        log.DEBUG,
-    )
+    if log.Log.is_logged(log.DEBUG):
+        log.Log(
+            "Copying attributes from path {fp!r} to path {tp!r}".format(
+                fp=rpin, tp=rpout
+            ),
+            log.DEBUG,
+        )
     assert rpin.lstat() == rpout.lstat() or rpin.isspecial(), (
         "Input '{irp!r}' and output '{orp!r}' paths must exist likewise, "
         "or input be special.".format(irp=rpin, orp=rpout)
@@ -1701,12 +1720,13 @@ def copy_attribs_inc(rpin, rpout):
     originals.  Therefore, don't copy all directory acl and
     permissions.
     """
-    log.Log(
-        "Copying inc attributes from path {fp!r} to path {tp!r}".format(
-            fp=rpin, tp=rpout
-        ),
-        log.DEBUG,
-    )
+    if log.Log.is_logged(log.DEBUG):
+        log.Log(
+            "Copying inc attributes from path {fp!r} to path {tp!r}".format(
+                fp=rpin, tp=rpout
+            ),
+            log.DEBUG,
+        )
     _check_for_files(rpin, rpout)
     if generics.change_ownership:
         rpout.chown(*rpin.getuidgid())
@@ -1752,10 +1772,11 @@ def rename(rp_source, rp_dest):
         "Source '{srp!r}' and destination '{drp!r}' paths must have the "
         "same connection for renaming.".format(srp=rp_source, drp=rp_dest)
     )
-    log.Log(
-        "Renaming from path {fp} to path {tp}".format(fp=rp_source, tp=rp_dest),
-        log.DEBUG,
-    )
+    if log.Log.is_logged(log.DEBUG):
+        log.Log(
+            "Renaming from path {fp} to path {tp}".format(fp=rp_source, tp=rp_dest),
+            log.DEBUG,
+        )
     if not rp_source.lstat():
         rp_dest.delete()
     else:
@@ -66,7 +66,7 @@ def parse(args, version_string, generic_parsers, actions_dict=None):
     Returns a dictionary containing the parsed parameters,
     readable files having been read as string or bytes.
     """
-    parser = get_parser(version_string, generic_parsers, actions_dict)
+    parser = _get_cached_parser(version_string, generic_parsers, actions_dict)
     parsed_args = parse_args(parser, args)
     parsed_values = vars(parsed_args)  # make a dictionary out of a Namespace
     for key, value in parsed_values.items():
@@ -101,6 +101,24 @@ def get_parser(version_string, parent_parsers, actions_dict):
     return parser
 
 
+def _get_cached_parser(version_string, parent_parsers, actions_dict):
+    """
+    Return a parser for the given parameters, re-using an already built one
+
+    Building the parser with all its sub-parsers is costly compared to the
+    parsing itself, and the same parser is typically requested again and
+    again when main_run is called repeatedly within the same process.
+    """
+    if not hasattr(_get_cached_parser, "parsers"):
+        _get_cached_parser.parsers = {}
+    key = (version_string, tuple(parent_parsers), tuple(actions_dict.items()))
+    parser = _get_cached_parser.parsers.get(key)
+    if parser is None:
+        parser = get_parser(version_string, parent_parsers, actions_dict)
+        _get_cached_parser.parsers[key] = parser
+    return parser
+
+
 def _add_version_option_to_parser(parser, version_string):
     """
     Adds the version option to the given parser
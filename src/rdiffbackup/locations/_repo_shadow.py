@@ -24,6 +24,9 @@ it has no real life of itself, i.e. it has only class methods and can't
 be instantiated.
 """
 
+import bisect
+import collections
+import concurrent.futures
 import errno
 import io
 import os
@@ -66,6 +69,8 @@ class RepoShadow(location.LocationShadow):
     _select = None
     # This will be set to the time of the current mirror
     _mirror_time = None
+    # This will cache the sorted increment times per increment path
+    _increment_times = {}
     # This will be set to the exact time to restore to (not restore_to_time)
     _restore_time = None
     # _regress_time should be set to the time we want to regress back to
@@ -140,6 +145,7 @@ class RepoShadow(location.LocationShadow):
         cls._has_been_locked = False
         # we need this to be able to use multiple times the class
         cls._mirror_time = None
+        cls._increment_times = {}
         cls._restore_time = None
         cls._regress_time = None
         cls._unsuccessful_backup_time = None
@@ -251,6 +257,7 @@ class RepoShadow(location.LocationShadow):
     # @API(RepoShadow.exit, 300)
     @classmethod
     def exit(cls):
+        _RestoreFile.shutdown_stat_pool()
         cls._unlock()
         log.ErrorLog.close()
         if cls._logging_to_file:
@@ -284,8 +291,11 @@ class RepoShadow(location.LocationShadow):
         else:
             ITR = rorpiter.IterTreeReducer(_RepoPatchITRB, [cls._base_dir, cls.CCPP])
             log_msg = "Processing file {cf}"
+        # avoid formatting the message for each file if it isn't logged
+        log_files = log.Log.is_logged(log.INFO)
         for diff in rorpiter.FillInIter(source_diffiter, cls._base_dir):
-            log.Log(log_msg.format(cf=diff), log.INFO)
+            if log_files:
+                log.Log(log_msg.format(cf=diff), log.INFO)
             ITR(diff.index, diff)
         ITR.finish_processing()
         cls.CCPP.close()
@@ -564,28 +574,30 @@ class RepoShadow(location.LocationShadow):
         Yield signatures of any changed destination files
         """
         flush_threshold = consts.PIPELINE_MAX_LENGTH - 2
-        num_rorps_seen = 0
-        for src_rorp, dest_rorp in cls.CCPP:
+        preserve_hardlinks = generics.preserve_hardlinks
+        # bind the methods called per changed file once, outside of the loop
+        flag_changed = cls.CCPP.flag_changed
+        get_one_sig = cls._get_one_sig
+        rorp_eq = map_hardlinks.rorp_eq
+        for num_rorps_seen, (src_rorp, dest_rorp) in enumerate(cls.CCPP):
             # If we are backing up across a pipe, we must flush the pipeline
             # every so often so it doesn't get congested on destination end.
-            if not is_local:
-                num_rorps_seen += 1
-                if num_rorps_seen > flush_threshold:
-                    num_rorps_seen = 0
-                    yield iterfile.MiscIterFlushRepeat
+            if (
+                not is_local
+                and num_rorps_seen
+                and num_rorps_seen % flush_threshold == 0
+            ):
+                yield iterfile.MiscIterFlushRepeat
             if not (
                 src_rorp
                 and dest_rorp
                 and src_rorp == dest_rorp
-                and (
-                    not generics.preserve_hardlinks
-                    or map_hardlinks.rorp_eq(src_rorp, dest_rorp)
-                )
+                and (not preserve_hardlinks or rorp_eq(src_rorp, dest_rorp))
             ):
                 index = src_rorp and src_rorp.index or dest_rorp.index
-                sig = cls._get_one_sig(baserp, index, src_rorp, dest_rorp)
+                sig = get_one_sig(baserp, index, src_rorp, dest_rorp)
                 if sig:
-                    cls.CCPP.flag_changed(index)
+                    flag_changed(index)
                     yield sig
 
     @classmethod
@@ -670,6 +682,7 @@ class RepoShadow(location.LocationShadow):
             pid = "NA"
         mirrorrp.write_string("PID {pp}\n".format(pp=pid))
         mirrorrp.fsync_with_dir()
+        cls._increment_times = {}  # they depend on the current mirror(s)
 
     # @API(RepoShadow.remove_current_mirror, 201)
     @classmethod
@@ -685,10 +698,7 @@ class RepoShadow(location.LocationShadow):
         ), "There must be two current mirrors not '{ilen}'.".format(
             ilen=len(curmir_incs)
         )
-        if curmir_incs[0].getinctime() < curmir_incs[1].getinctime():
-            older_inc = curmir_incs[0]
-        else:
-            older_inc = curmir_incs[1]
+        older_inc = min(curmir_incs, key=lambda inc: inc.getinctime())
         if generics.do_fsync:
             # Make sure everything is written before current_mirror is removed
             C.sync()
@@ -746,6 +756,7 @@ class RepoShadow(location.LocationShadow):
         # this function is only used internally (for now) but it might change
         # hence it looks like an external function potentially called remotely
         if cls._mirror_time is None or refresh:
+            cls._increment_times = {}  # they depend on the mirror time
             cur_mirror_incs = cls._data_dir.append(
                 b"current_mirror"
             ).get_incfiles_list()
@@ -799,18 +810,22 @@ class RepoShadow(location.LocationShadow):
 
         Take the total list of times from the increments.<time>.dir
         file and the mirror_metadata file.  Sorted ascending.
+
+        The list is cached per increment path, it must not be modified.
         """
-        # use set to remove duplicate times between increments and metadata
-        times_set = {cls.get_mirror_time(must_exist=True)}
         if not rp or not rp.index:
             rp = cls._data_dir.append(b"increments")
-        for inc in rp.get_incfiles_list():
-            times_set.add(inc.getinctime())
-        mirror_meta_rp = cls._data_dir.append(b"mirror_metadata")
-        for inc in mirror_meta_rp.get_incfiles_list():
-            times_set.add(inc.getinctime())
-        return_list = sorted(times_set)
-        return return_list
+        mirror_time = cls.get_mirror_time(must_exist=True)  # might reset cache
+        if rp.path not in cls._increment_times:
+            # use set to remove duplicate times between increments and metadata
+            times_set = {mirror_time}
+            for inc in rp.get_incfiles_list():
+                times_set.add(inc.getinctime())
+            mirror_meta_rp = cls._data_dir.append(b"mirror_metadata")
+            for inc in mirror_meta_rp.get_incfiles_list():
+                times_set.add(inc.getinctime())
+            cls._increment_times[rp.path] = sorted(times_set)
+        return cls._increment_times[rp.path]
 
     @classmethod
     def _initialize_restore(cls, restore_to_time):
@@ -927,12 +942,12 @@ class RepoShadow(location.LocationShadow):
         So if restore_to_time is inbetween two increments, return the
         older one.
         """
-        inctimes = cls.get_increment_times()
-        older_times = [otime for otime in inctimes if otime <= restore_to_time]
-        if older_times:
-            cls._restore_time = max(older_times)
+        inctimes = cls.get_increment_times()  # sorted ascending
+        older_count = bisect.bisect_right(inctimes, restore_to_time)
+        if older_count:
+            cls._restore_time = inctimes[older_count - 1]
         else:  # restore time older than oldest increment, just return that
-            cls._restore_time = min(inctimes)
+            cls._restore_time = inctimes[0]
         return cls._restore_time
 
     @classmethod
@@ -948,35 +963,45 @@ class RepoShadow(location.LocationShadow):
     @classmethod
     def _get_diffs_from_collated(cls, collated):
         """Get diff iterator from collated"""
+        preserve_hardlinks = generics.preserve_hardlinks
+        # bind the functions called per file once, outside of the loop
+        add_rorp = map_hardlinks.add_rorp
+        del_rorp = map_hardlinks.del_rorp
+        rorp_eq = map_hardlinks.rorp_eq
+        get_diff = cls._get_diff
+        base_index = cls.mirror_base.index
         for mir_rorp, target_rorp in collated:
-            if generics.preserve_hardlinks and mir_rorp:
-                map_hardlinks.add_rorp(mir_rorp, target_rorp)
+            track_hardlinks = preserve_hardlinks and mir_rorp
+            if track_hardlinks:
+                add_rorp(mir_rorp, target_rorp)
             if (
-                not target_rorp
-                or not mir_rorp
-                or not mir_rorp == target_rorp
-                or (
-                    generics.preserve_hardlinks
-                    and not map_hardlinks.rorp_eq(mir_rorp, target_rorp)
-                )
+                target_rorp
+                and mir_rorp
+                and mir_rorp == target_rorp
+                and (not track_hardlinks or rorp_eq(mir_rorp, target_rorp))
             ):
-                diff = cls._get_diff(mir_rorp, target_rorp)
-            else:
                 diff = None
-            if generics.preserve_hardlinks and mir_rorp:
-                map_hardlinks.del_rorp(mir_rorp)
+            else:
+                diff = get_diff(mir_rorp, target_rorp, base_index)
+            if track_hardlinks:
+                del_rorp(mir_rorp)
             if diff:
                 yield diff
 
     @classmethod
-    def _get_diff(cls, mir_rorp, target_rorp):
-        """Get a diff for mir_rorp at time"""
+    def _get_diff(cls, mir_rorp, target_rorp, base_index):
+        """
+        Get a diff for mir_rorp at time
+
+        base_index is the index of the mirror base, it is passed by the caller
+        as it doesn't change during a restore.
+        """
         if not mir_rorp:
             mir_rorp = rpath.RORPath(target_rorp.index)
         elif generics.preserve_hardlinks and map_hardlinks.is_linked(mir_rorp):
             mir_rorp.flaglinked(map_hardlinks.get_link_index(mir_rorp))
         elif mir_rorp.isreg():
-            expanded_index = cls.mirror_base.index + mir_rorp.index
+            expanded_index = base_index + mir_rorp.index
             file_fp = cls.rf_cache.get_fp(expanded_index, mir_rorp)
             mir_rorp.setfile(hash.FileWrapper(file_fp))
         mir_rorp.set_attached_filetype("snapshot")
@@ -1116,11 +1141,8 @@ class RepoShadow(location.LocationShadow):
                 {"time": mirror_time, "size": mirror_total, "total_size": mirror_total}
             )
 
-            inc_times = list(time_dict.keys())
-            inc_times.sort()
-            inc_times.reverse()
             cumulative_size = mirror_total
-            for inc_time in inc_times:
+            for inc_time in sorted(time_dict, reverse=True):
                 size = time_dict[inc_time]
                 cumulative_size += size
                 triples.append(
@@ -1491,6 +1513,9 @@ information in it.
                 # Sync first, since we are marking dest dir as good now
                 C.sync()
             former_current_mirror_rp.delete()
+        # the unsuccessful backup is gone, times must be read again
+        cls._mirror_time = None
+        cls._increment_times = {}
         return consts.RET_CODE_OK
 
     # @API(RepoShadow.force_regress, 300)
@@ -1634,6 +1659,7 @@ information in it.
         backup time.  _mirror_time is the unsuccessful backup time.
         """
         cls._mirror_time = cls._unsuccessful_backup_time
+        cls._increment_times = {}  # they depend on the mirror time
         cls._restore_time = cls._regress_time
 
     @classmethod
@@ -1937,6 +1963,30 @@ information in it.
             return "special"
 
 
+class _CacheEntry:
+    """
+    Entry of the _CacheCollatedPostProcess cache for a single index
+
+    changed should be true if the rorps are different.
+
+    success should be 1 if dest_rorp has been successfully updated to
+    source_rorp, and 2 if the destination file is deleted entirely.
+    They both default to false (0).
+
+    inc holds the RPath of the increment file if one exists.  It is used
+    to record file statistics.
+    """
+
+    __slots__ = ("source_rorp", "dest_rorp", "changed", "success", "inc")
+
+    def __init__(self, source_rorp, dest_rorp):
+        self.source_rorp = source_rorp
+        self.dest_rorp = dest_rorp
+        self.changed = 0
+        self.success = 0
+        self.inc = None
+
+
 class _CacheCollatedPostProcess:
     """
     Cache a collated iter of (source_rorp, dest_rorp) pairs
@@ -1984,20 +2034,10 @@ class _CacheCollatedPostProcess:
             statistics.FileStats.init(self.data_rp)
         self.metawriter = meta_mgr.get_meta_manager().get_writer()
 
-        # the following should map indices to lists
-        # [source_rorp, dest_rorp, changed_flag, success_flag, increment]
-
-        # changed_flag should be true if the rorps are different, and
-
-        # success_flag should be 1 if dest_rorp has been successfully
-        # updated to source_rorp, and 2 if the destination file is
-        # deleted entirely.  They both default to false (0).
-
-        # increment holds the RPath of the increment file if one
-        # exists.  It is used to record file statistics.
-
+        # the following maps indices to _CacheEntry objects, with
+        # indices ordered from oldest to newest in cache_indices
         self.cache_dict = {}
-        self.cache_indices = []
+        self.cache_indices = collections.deque()
 
         # Contains a list of pairs (destination_rps, permissions) to
         # be used to reset the permissions of certain directories
@@ -2007,21 +2047,23 @@ class _CacheCollatedPostProcess:
         # Contains list of (index, (source_rorp, diff_rorp)) pairs for
         # the parent directories of the last item in the cache.
         self.parent_list = []
+        # Maps the same indices to their (source_rorp, diff_rorp) pairs
+        # so that parents can be looked up without scanning the list.
+        self.parent_dict = {}
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        """Return next (source_rorp, dest_rorp) pair.  StopIteration passed"""
-        source_rorp, dest_rorp = next(self.iter)
-        self._pre_process(source_rorp, dest_rorp)
-        index = source_rorp and source_rorp.index or dest_rorp.index
-        self.cache_dict[index] = [source_rorp, dest_rorp, 0, 0, None]
-        self.cache_indices.append(index)
-
-        if len(self.cache_indices) > self.cache_size:
-            self._shorten_cache()
-        return source_rorp, dest_rorp
+        """Yield (source_rorp, dest_rorp) pairs, caching them on the way"""
+        # a generator is resumed for each file at a lower cost than a call
+        # to a __next__ method, hence this isn't an iterator class anymore
+        for source_rorp, dest_rorp in self.iter:
+            self._pre_process(source_rorp, dest_rorp)
+            index = source_rorp and source_rorp.index or dest_rorp.index
+            self.cache_dict[index] = _CacheEntry(source_rorp, dest_rorp)
+            self.cache_indices.append(index)
+
+            if len(self.cache_indices) > self.cache_size:
+                self._shorten_cache()
+            yield source_rorp, dest_rorp
 
     def in_cache(self, index):
         """Return true if given index is cached"""
@@ -2029,26 +2071,27 @@ class _CacheCollatedPostProcess:
 
     def flag_success(self, index):
         """Signal that the file with given index was updated successfully"""
-        self.cache_dict[index][3] = 1
+        self.cache_dict[index].success = 1
 
     def flag_deleted(self, index):
         """Signal that the destination file was deleted"""
-        self.cache_dict[index][3] = 2
+        self.cache_dict[index].success = 2
 
     def flag_changed(self, index):
         """Signal that the file with given index has changed"""
-        self.cache_dict[index][2] = 1
+        self.cache_dict[index].changed = 1
 
     def set_inc(self, index, inc):
         """Set the increment of the current file"""
-        self.cache_dict[index][4] = inc
+        self.cache_dict[index].inc = inc
 
     def get_rorps(self, index):
         """Retrieve (source_rorp, dest_rorp) from cache"""
         try:
-            return self.cache_dict[index][:2]
+            entry = self.cache_dict[index]
         except KeyError:
             return self._get_parent_rorps(index)
+        return (entry.source_rorp, entry.dest_rorp)
 
     def get_source_rorp(self, index):
         """Retrieve source_rorp with given index from cache"""
@@ -2057,14 +2100,14 @@ class _CacheCollatedPostProcess:
             "{cached!r}.".format(idx=index, cached=self.cache_indices[0])
         )
         try:
-            return self.cache_dict[index][0]
+            return self.cache_dict[index].source_rorp
         except KeyError:
             return self._get_parent_rorps(index)[0]
 
     def get_mirror_rorp(self, index):
         """Retrieve mirror_rorp with given index from cache"""
         try:
-            return self.cache_dict[index][1]
+            return self.cache_dict[index].dest_rorp
         except KeyError:
             return self._get_parent_rorps(index)[1]
 
@@ -2074,12 +2117,12 @@ class _CacheCollatedPostProcess:
 
         Return True if modified, else False.
         """
-        target_rorp = self.get_mirror_rorp(index)
+        source_rorp, target_rorp = self.get_rorps(index)  # one single lookup
         if target_rorp and target_rorp.has_sha1():
             old_sha1 = target_rorp.get_sha1()
         else:
             old_sha1 = None
-        self.get_source_rorp(index).set_sha1(sha1sum)
+        source_rorp.set_sha1(sha1sum)
         return old_sha1 != sha1sum
 
     def update_hardlink_hash(self, diff_rorp):
@@ -2094,9 +2137,11 @@ class _CacheCollatedPostProcess:
         """Process the remaining elements in the cache"""
         while self.cache_indices:
             self._shorten_cache()
-        while self.dir_perms_list:
-            dir_rp, perms = self.dir_perms_list.pop()
+        # reset sub-directories before their parents, which might lose the
+        # permissions needed to access them
+        for dir_rp, perms in reversed(self.dir_perms_list):
             dir_rp.chmod(perms)
+        self.dir_perms_list.clear()
         self.metawriter.close()
         meta_mgr.get_meta_manager().convert_meta_main_to_diff()
 
@@ -2135,28 +2180,23 @@ class _CacheCollatedPostProcess:
 
     def _shorten_cache(self):
         """Remove one element from cache, possibly adding it to metadata"""
-        first_index = self.cache_indices[0]
-        del self.cache_indices[0]
+        first_index = self.cache_indices.popleft()
         try:
-            (
-                old_source_rorp,
-                old_dest_rorp,
-                changed_flag,
-                success_flag,
-                inc,
-            ) = self.cache_dict[first_index]
+            entry = self.cache_dict.pop(first_index)
         except KeyError:  # probably caused by error in file system (dup)
             log.Log(
                 "Index {ix} missing from CCPP cache".format(ix=first_index), log.WARNING
             )
             return
-        del self.cache_dict[first_index]
+        source_rorp, dest_rorp = entry.source_rorp, entry.dest_rorp
         self._post_process(
-            old_source_rorp, old_dest_rorp, changed_flag, success_flag, inc
+            source_rorp, dest_rorp, entry.changed, entry.success, entry.inc
         )
         if self.dir_perms_list:
             self._reset_dir_perms(first_index)
-        self._update_parent_list(first_index, old_source_rorp, old_dest_rorp)
+        # only directories are kept as parents, avoid the call for most files
+        if (source_rorp and source_rorp.isdir()) or (dest_rorp and dest_rorp.isdir()):
+            self._update_parent_list(first_index, source_rorp, dest_rorp)
 
     def _update_parent_list(self, index, src_rorp, dest_rorp):
         """
@@ -2167,9 +2207,10 @@ class _CacheCollatedPostProcess:
         cache.  This is necessary because we may realize we need a
         parent directory's information after we have processed many
         subfiles.
+
+        At least one of src_rorp and dest_rorp must be a directory, this is
+        checked by the caller.
         """
-        if not (src_rorp and src_rorp.isdir() or dest_rorp and dest_rorp.isdir()):
-            return  # neither is directory
         assert (
             self.parent_list or index == ()
         ), "Index '{idx}' must be empty if no parent in list".format(idx=index)
@@ -2192,8 +2233,11 @@ class _CacheCollatedPostProcess:
                         idx=index, pidx=last_parent_index, lvl=(li - 1)
                     )
                 )
-                self.parent_list = self.parent_list[:li]
+                for old_parent_index, discard in self.parent_list[li:]:
+                    del self.parent_dict[old_parent_index]
+                del self.parent_list[li:]
         self.parent_list.append((index, (src_rorp, dest_rorp)))
+        self.parent_dict[index] = (src_rorp, dest_rorp)
 
     def _post_process(self, source_rorp, dest_rorp, changed, success, inc):
         """
@@ -2236,10 +2280,7 @@ class _CacheCollatedPostProcess:
 
     def _get_parent_rorps(self, index):
         """Retrieve (src_rorp, dest_rorp) pair from parent cache"""
-        for parent_index, pair in self.parent_list:
-            if parent_index == index:
-                return pair
-        raise KeyError(index)
+        return self.parent_dict[index]  # raises KeyError(index) if missing
 
 
 class _RepoPatchITRB(rorpiter.ITRBranch):
@@ -2301,11 +2342,13 @@ class _RepoPatchITRB(rorpiter.ITRBranch):
                     is None
                 ):
                     self.CCPP.flag_success(index)
+                    return  # tf has been renamed, nothing to clean-up
             elif mirror_rp and mirror_rp.lstat():
                 mirror_rp.delete()
                 self.CCPP.flag_deleted(index)
-        # final clean-up
-        tf.setdata()
+        # final clean-up, tf's data is already current if unchanged
+        if result != self.UNCHANGED:
+            tf.setdata()
         if tf.lstat():
             tf.delete()
 
@@ -2349,7 +2392,8 @@ class _RepoPatchITRB(rorpiter.ITRBranch):
         Returns True if able to write new as desired, False if
         UpdateError or similar gets in the way.
         """
-        if diff_rorp.isflaglinked():
+        is_flaglinked = diff_rorp.isflaglinked()
+        if is_flaglinked:
             result = self._patch_hardlink_to_temp(basis_rp, diff_rorp, new)
             if result == self.FAILED or result == self.UNCHANGED:
                 return result
@@ -2362,7 +2406,7 @@ class _RepoPatchITRB(rorpiter.ITRBranch):
             if result == self.FAILED or result == self.UNCHANGED:
                 return result
         if new.lstat():
-            if diff_rorp.isflaglinked():
+            if is_flaglinked:
                 if generics.eas_write:
                     # `isflaglinked() == True` implies that we are processing
                     # the 2nd (or later) file in a group of files linked to an
@@ -2549,11 +2593,13 @@ class _RepoIncrementITRB(_RepoPatchITRB):
                         is None
                     ):
                         self.CCPP.flag_success(index)
+                        return  # tf has been renamed, nothing to clean-up
                 elif mirror_rp.lstat():
                     mirror_rp.delete()
                     self.CCPP.flag_deleted(index)
-        # final clean-up
-        tf.setdata()
+        # final clean-up, tf's data is already current if unchanged
+        if result != self.UNCHANGED:
+            tf.setdata()
         if tf.lstat():
             tf.delete()
 
@@ -2603,7 +2649,7 @@ class _CachedRF:
     def __init__(self, root_rf):
         """Initialize _CachedRF, self.rf_list variable"""
         self.root_rf = root_rf
-        self.rf_list = []  # list should filled in index order
+        self.rf_list = collections.deque()  # filled in index order
         if specifics.process_uid != 0:
             self.perm_changer = _PermissionChanger(root_rf.mirror_rp)
 
@@ -2649,7 +2695,7 @@ class _CachedRF:
                 if index[:-1] == rf.index[:-1] or not self._add_rfs(index, mir_rorp):
                     return None
             else:
-                del self.rf_list[0]
+                self.rf_list.popleft()
 
     def _add_rfs(self, index, mir_rorp=None):
         """Given index, add the rfs in that same directory
@@ -2673,7 +2719,7 @@ class _CachedRF:
         new_rfs = list(temp_rf.yield_sub_rfs())
         if not new_rfs:
             return 0
-        self.rf_list[0:0] = new_rfs
+        self.rf_list.extendleft(reversed(new_rfs))
         return 1
 
     def _debug_list_rfs_in_cache(self, index):
@@ -2693,6 +2739,16 @@ class _RestoreFile:
     will be the first element in self.relevant.incs
     """
 
+    # threads used to stat the entries of large local mirror directories
+    # ahead of their use, created only once needed and only as root, because
+    # otherwise setdata_local might chmod files concurrently to the
+    # _PermissionChanger
+    _stat_pool = None
+    _STAT_POOL_MIN_ENTRIES = 64
+    _STAT_POOL_LOOKAHEAD = 256
+    # restored files up to this size are kept in memory after patching
+    _SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
     def __init__(self, mirror_rp, inc_rp, inc_list):
         self.index = mirror_rp.index
         self.mirror_rp = mirror_rp
@@ -2730,14 +2786,13 @@ class _RestoreFile:
             return
 
         newer_incs = self.get_newer_incs()
-        i = 0
-        while i < len(newer_incs):
-            # Only diff type increments require later versions
-            if newer_incs[i].getinctype() != b"diff":
-                break
-            i = i + 1
+        # Only diff type increments require later versions
+        i = next(
+            (idx for idx, inc in enumerate(newer_incs) if inc.getinctype() != b"diff"),
+            len(newer_incs),
+        )
         self.relevant_incs = newer_incs[: i + 1]
-        if not self.relevant_incs or self.relevant_incs[-1].getinctype() == b"diff":
+        if i == len(newer_incs):  # only diffs (or nothing), mirror required
             self.relevant_incs.append(self.mirror_rp)
         self.relevant_incs.reverse()  # return in reversed order
 
@@ -2748,13 +2803,19 @@ class _RestoreFile:
         Also discard increments older than rest_time (rest_time we are
         assuming is the exact time rdiff-backup was run, so no need to
         consider the next oldest increment or any of that)
+
+        Only the returned increments are stat'ed, if not already done,
+        the other ones aren't needed.
         """
         incpairs = []
         for inc in self.inc_list:
             inc_time = inc.getinctime()
             if inc_time >= self._restore_time:
+                if not inc.lstat():
+                    inc.setdata()
                 incpairs.append((inc_time, inc))
-        incpairs.sort()
+        # sort on time only, rpaths can't be compared anyway
+        incpairs.sort(key=lambda pair: pair[0])
         return [pair[1] for pair in incpairs]
 
     def get_attribs(self):
@@ -2781,14 +2842,20 @@ class _RestoreFile:
 
         def get_fp():
             current_fp = self._get_first_fp()
-            for inc_diff in self.relevant_incs[1:]:
+            inc_diffs = self.relevant_incs[1:]
+            for inc_diff in inc_diffs:
                 log.Log("Applying patch file {pf}".format(pf=inc_diff), log.DEBUG)
                 assert (
                     inc_diff.getinctype() == b"diff"
                 ), "Path '{irp!r}' must be of type 'diff'.".format(irp=inc_diff)
                 delta_fp = inc_diff.open("rb", inc_diff.isinccompressed())
                 try:
-                    new_fp = tempfile.TemporaryFile()
+                    if inc_diff is inc_diffs[-1]:
+                        # the final result isn't used as basis for patching,
+                        # so it doesn't need to be a real file
+                        new_fp = tempfile.SpooledTemporaryFile(self._SPOOL_MAX_SIZE)
+                    else:
+                        new_fp = tempfile.TemporaryFile()
                     Rdiff.write_patched_fp(current_fp, delta_fp, new_fp)
                     new_fp.seek(0)
                 except OSError:
@@ -2843,7 +2910,8 @@ rdiff-backup destination directory, or a bug in rdiff-backup""".format(
 
         for mirror_rp, inc_pair in collated:
             if not inc_pair:
-                inc_rp = self.inc_rp.new_index(mirror_rp.index)
+                # neither increments nor directory, no need to stat it
+                inc_rp = self.inc_rp.new_index_empty(mirror_rp.index)
                 inc_list = []
             else:
                 inc_rp, inc_list = inc_pair
@@ -2856,6 +2924,7 @@ rdiff-backup destination directory, or a bug in rdiff-backup""".format(
 
         Finds pairs under directory inc_rpath.  sub_inc_rpath will just be
         the prefix rp, while the rps in inc_list should actually exist.
+        The increment rps aren't stat'ed yet, see get_newer_incs.
 
         """
         if not inc_rpath.isdir():
@@ -2868,33 +2937,42 @@ rdiff-backup destination directory, or a bug in rdiff-backup""".format(
 
             def add_to_dict(filename):
                 """Add filename to the inc tuple dictionary"""
+                # increments are recognized by their name, so that only the
+                # other entries need to be stat'ed to find sub-directories
+                inc_info = rpath.get_incfile_info(filename)
+                if inc_info:
+                    _, _, inc_type, basename = inc_info
+                    if inc_type != b"data":
+                        inc_filename_list = inc_dict.setdefault(basename, [])
+                        inc_filename_list.append(filename)
+                        return
                 rp = inc_rpath.append(filename)
-                if rp.isincfile() and rp.getinctype() != b"data":
-                    basename = rp.getincbase_bname()
-                    inc_filename_list = inc_dict.setdefault(basename, [])
-                    inc_filename_list.append(filename)
-                elif rp.isdir():
+                if rp.isdir():
                     inc_dict.setdefault(filename, [])
+                    dir_rps[filename] = rp
 
             for filename in dirlist:
                 add_to_dict(filename)
             return list(inc_dict.items())
 
         def inc_filenames2incrps(filenames):
-            """Map list of filenames into increment rps"""
+            """Map list of filenames into (not yet stat'ed) increment rps"""
             inc_list = []
             for filename in filenames:
-                rp = inc_rpath.append(filename)
+                rp = inc_rpath.new_index_empty(inc_rpath.index + (filename,))
                 assert rp.isincfile(), "Path '{mrp}' must be an increment file.".format(
                     mrp=rp
                 )
                 inc_list.append(rp)
             return inc_list
 
+        dir_rps = {}  # the sub-directories already stat'ed by get_inc_pairs
         items = get_inc_pairs()
         items.sort()  # Sorting on basis of basename now
         for basename, inc_filenames in items:
-            sub_inc_rpath = inc_rpath.append(basename)
+            sub_inc_rpath = dir_rps.get(basename)
+            if sub_inc_rpath is None:  # only increments, no directory
+                sub_inc_rpath = inc_rpath.new_index_empty(inc_rpath.index + (basename,))
             yield rorpiter.IndexedTuple(
                 sub_inc_rpath.index,
                 (sub_inc_rpath, inc_filenames2incrps(inc_filenames)),
@@ -2930,10 +3008,50 @@ rdiff-backup destination directory, or a bug in rdiff-backup""".format(
         assert mirrorrp.isdir(), "Mirror path '{mrp}' must be a directory.".format(
             mrp=mirrorrp
         )
-        for filename in robust.listrp(mirrorrp):
-            rp = mirrorrp.append(filename)
-            if rp.index != (b"rdiff-backup-data",):
-                yield rp
+        filenames = robust.listrp(mirrorrp)
+        if not mirrorrp.index:
+            # don't even stat the data directory, it's skipped anyway
+            filenames = [x for x in filenames if x != b"rdiff-backup-data"]
+        if (
+            len(filenames) < self._STAT_POOL_MIN_ENTRIES
+            or mirrorrp.conn is not specifics.local_connection
+            or specifics.process_uid != 0
+        ):
+            yield from map(mirrorrp.append, filenames)
+        else:
+            yield from self._yield_statted_ahead(mirrorrp, filenames)
+
+    @classmethod
+    def _yield_statted_ahead(cls, mirrorrp, filenames):
+        """
+        Yield mirrorrps of the sorted filenames, stat'ed in parallel
+
+        On high latency storage (NFS, NAS...) creating each rpath is mostly
+        waiting for lstat, hence a few of them are created ahead in threads.
+        The order of the filenames is kept, as Collate2Iters relies on it.
+        """
+        # explicitly set on the base class so that sub-classes share the pool
+        if _RestoreFile._stat_pool is None:
+            _RestoreFile._stat_pool = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="stat"
+            )
+        stat_pool = _RestoreFile._stat_pool
+        pending = collections.deque()
+        for filename in filenames:
+            if len(pending) >= cls._STAT_POOL_LOOKAHEAD:
+                yield pending.popleft().result()
+            pending.append(stat_pool.submit(mirrorrp.append, filename))
+        while pending:
+            yield pending.popleft().result()
+
+    @classmethod
+    def shutdown_stat_pool(cls):
+        """
+        Stop the threads used to stat ahead, if they were ever started
+        """
+        if _RestoreFile._stat_pool is not None:
+            _RestoreFile._stat_pool.shutdown()
+            _RestoreFile._stat_pool = None
 
     def _debug_relevant_incs_string(self):
         """Return printable string of relevant incs, used for debugging"""
@@ -2963,9 +3081,9 @@ class _PermissionChanger:
     def __init__(self, root_rp):
         self.root_rp = root_rp
         self.current_index = ()
-        # Below is a list of (index, rp, old_perm) triples in reverse
+        # Below is a deque of (index, rp, old_perm) triples in reverse
         # order that need clearing
-        self.open_index_list = []
+        self.open_index_list = collections.deque()
 
     def __call__(self, index, mir_rorp=None):
         """Given rpath, change permissions up to and including index"""
@@ -2991,7 +3109,7 @@ class _PermissionChanger:
                 old_rp.chmod(old_perms)
             else:
                 break
-            del self.open_index_list[0]
+            self.open_index_list.popleft()
 
     def _add_chmod_new(self, old_index, index):
         """Change permissions of directories between old_index and index"""
@@ -3000,7 +3118,7 @@ class _PermissionChanger:
                 rp.isdir() and not (rp.executable() and rp.readable())
             ):
                 old_perms = rp.getperms()
-                self.open_index_list.insert(0, (rp.index, rp, old_perms))
+                self.open_index_list.appendleft((rp.index, rp, old_perms))
                 if rp.isreg():
                     rp.chmod(0o400 | old_perms)
                 else:
@@ -3013,10 +3131,14 @@ class _PermissionChanger:
         directories are fixed before we need the inner dirs.
 
         """
-        for i in range(len(index) - 1, -1, -1):
-            if old_index[:i] == index[:i]:
-                common_prefix_len = i
-                break  # latest with i==0 does the break happen
+        # index itself is always new, hence the common prefix is shorter
+        max_prefix_len = min(len(old_index), len(index) - 1)
+        common_prefix_len = 0
+        while (
+            common_prefix_len < max_prefix_len
+            and old_index[common_prefix_len] == index[common_prefix_len]
+        ):
+            common_prefix_len += 1
 
         for total_len in range(common_prefix_len + 1, len(index) + 1):
             yield self.root_rp.new_index(index[:total_len])
@@ -66,22 +66,23 @@ def main_run(arglist, security_override=False):
 
     # instantiate the action object from the dictionary, handing over the
     # parsed arguments
-    action = discovered_actions[parsed_args["action"]](parsed_args)
+    action_name = parsed_args["action"]
+    action = discovered_actions[action_name](parsed_args)
 
-    log.Log(
-        "Runtime information =>{ri}<=".format(
-            ri=action.get_runtime_info(parsed=parsed_args)
-        ),
-        log.DEBUG,
-    )
+    # the runtime information is costly to gather, hence only if needed
+    if log.Log.is_logged(log.DEBUG):
+        log.Log(
+            "Runtime information =>{ri}<=".format(
+                ri=action.get_runtime_info(parsed=parsed_args)
+            ),
+            log.DEBUG,
+        )
 
     # validate that everything looks good before really starting
     ret_val |= action.pre_check()
     if ret_val & consts.RET_CODE_ERR:
         log.Log(
-            "Action {ac} failed on step {st}".format(
-                ac=parsed_args["action"], st="pre_check"
-            ),
+            "Action {ac} failed on step {st}".format(ac=action_name, st="pre_check"),
             log.ERROR,
         )
         return ret_val
@@ -90,9 +91,7 @@ def main_run(arglist, security_override=False):
     with action.connect() as conn_act:
         if not conn_act.is_connection_ok():
             log.Log(
-                "Action {ac} failed on step {st}".format(
-                    ac=parsed_args["action"], st="connect"
-                ),
+                "Action {ac} failed on step {st}".format(ac=action_name, st="connect"),
                 log.ERROR,
             )
             return conn_act.conn_status
@@ -104,53 +103,32 @@ def main_run(arglist, security_override=False):
 
             Security._security_level = "override"
 
-        ret_val |= conn_act.check()
-        if ret_val & consts.RET_CODE_ERR:
-            log.Log(
-                "Action {ac} failed on step {st}".format(
-                    ac=parsed_args["action"], st="check"
-                ),
-                log.ERROR,
-            )
-            return ret_val
-
-        ret_val |= conn_act.setup()
-        if ret_val & consts.RET_CODE_ERR:
-            log.Log(
-                "Action {ac} failed on step {st}".format(
-                    ac=parsed_args["action"], st="setup"
-                ),
-                log.ERROR,
-            )
-            return ret_val
-
-        ret_val |= conn_act.run()
-        if ret_val & consts.RET_CODE_ERR:
-            log.Log(
-                "Action {ac} failed on step {st}".format(
-                    ac=parsed_args["action"], st="run"
-                ),
-                log.ERROR,
-            )
-            return ret_val
+        for step in ("check", "setup", "run"):
+            ret_val |= getattr(conn_act, step)()
+            if ret_val & consts.RET_CODE_ERR:
+                log.Log(
+                    "Action {ac} failed on step {st}".format(ac=action_name, st=step),
+                    log.ERROR,
+                )
+                return ret_val
 
     # Give a final summary of what might have happened to the user
     if ret_val & consts.RET_CODE_WARN:
         log.Log(
             "Action {ac} emitted warnings, "
-            "see previous messages for details".format(ac=parsed_args["action"]),
+            "see previous messages for details".format(ac=action_name),
             log.WARNING,
         )
     if ret_val & consts.RET_CODE_FILE_ERR:
         log.Log(
             "Action {ac} failed on one or more files, "
-            "see previous messages for details".format(ac=parsed_args["action"]),
+            "see previous messages for details".format(ac=action_name),
             log.WARNING,
         )
     if ret_val & consts.RET_CODE_FILE_WARN:
         log.Log(
             "Action {ac} emitted a warning on one or more files, "
-            "see previous messages for details".format(ac=parsed_args["action"]),
+            "see previous messages for details".format(ac=action_name),
             log.WARNING,
         )
 
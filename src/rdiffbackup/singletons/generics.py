@@ -146,10 +146,10 @@ def get(setting_name: str) -> typing.Any:
     return globals()[setting_name]
 
 
-# This list is used by the set function below.  When a new
-# connection is created with init_connection, the variables
-# listed here will be dispatched to the connection's generics.
-changed_settings: list[str] = []
+# This dictionary is used as an ordered set by the set function below.
+# When a new connection is created with init_connection, the variables
+# listed here will be dispatched, each only once, to the connection's generics.
+changed_settings: dict[str, None] = {}
 
 
 def set(setting_name: str, value: typing.Any) -> None:
@@ -158,7 +158,7 @@ def set(setting_name: str, value: typing.Any) -> None:
     potentially delayed, on all others.
     """
     # we always save generic values here, so that they can be later transferred
-    changed_settings.append(setting_name)
+    changed_settings[setting_name] = None
     # if there are no connections yet, only set locally
     if specifics.connection_dict:
         for conn in specifics.connection_dict.values():
@@ -9,6 +9,7 @@ import commontest as comtst
 import fileset
 
 from rdiff_backup import rpath
+from rdiffbackup import run
 from rdiffbackup.locations import _repo_shadow
 from rdiffbackup.singletons import consts, specifics
 
@@ -282,6 +283,32 @@ class ActionRegressTest(unittest.TestCase):
         # all tests were successful
         self.success = True
 
+    def test_increment_times_after_regress(self):
+        """test that a regress doesn't leave stale increment times cached"""
+        # the forced regress caches the increment times before regressing
+        self.assertEqual(
+            run.main_run(
+                [
+                    "--api-version",
+                    "201",
+                    "--force",
+                    "regress",
+                    os.fsdecode(self.bak_path),
+                ],
+                security_override=True,
+            ),
+            consts.RET_CODE_OK,
+        )
+        comtst.reset_connections()
+        cached_times = _repo_shadow.RepoShadow.get_increment_times()
+        self.assertEqual(cached_times, [10000, 20000])
+        # compare with the times freshly read from the repository
+        _repo_shadow.RepoShadow._increment_times = {}
+        self.assertEqual(cached_times, _repo_shadow.RepoShadow.get_increment_times())
+
+        # all tests were successful
+        self.success = True
+
     def tearDown(self):
         # we clean-up only if the test was successful
         if self.success:
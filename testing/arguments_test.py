@@ -80,6 +80,39 @@ class ArgumentsTest(unittest.TestCase):
                 disc_actions,
             )
 
+    def test_parser_cache(self):
+        """
+        - verify that the parser is built only once for the same parameters
+        """
+        disc_actions = actions_mgr.get_actions_dict()
+        generic_parsers = actions_mgr.get_generic_parsers()
+
+        parser1 = arguments._get_cached_parser(
+            "testing 0.1.0", generic_parsers, disc_actions
+        )
+        parser2 = arguments._get_cached_parser(
+            "testing 0.1.0", generic_parsers, disc_actions
+        )
+        self.assertIs(parser1, parser2)
+        parser3 = arguments._get_cached_parser(
+            "testing 0.1.1", generic_parsers, disc_actions
+        )
+        self.assertIsNot(parser1, parser3)
+
+        # the cached parser still parses each argument list independently
+        values = arguments.parse(
+            ["list", "increments", "repo1"],
+            "testing 0.1.0",
+            generic_parsers,
+            disc_actions,
+        )
+        self.assertEqual(["repo1"], values["locations"])
+        values = arguments.parse(
+            ["list", "files", "repo2"], "testing 0.1.0", generic_parsers, disc_actions
+        )
+        self.assertEqual("files", values["entity"])
+        self.assertEqual(["repo2"], values["locations"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -53,6 +53,18 @@ class LogTest(unittest.TestCase):
         self.assertEqual(testlog.file_verbosity, log.DEBUG)
         self.assertEqual(testlog.term_verbosity, log.WARNING)
 
+    def test_log_is_logged(self):
+        """test that the verbosity check considers both file and terminal"""
+        testlog = log.Logger()
+        testlog.set_verbosity(str(log.INFO), str(log.WARNING))
+        self.assertTrue(testlog.is_logged(log.ERROR))
+        self.assertTrue(testlog.is_logged(log.INFO))
+        self.assertFalse(testlog.is_logged(log.DEBUG))
+        testlog.set_verbosity(str(log.NONE), str(log.DEBUG))
+        self.assertTrue(testlog.is_logged(log.DEBUG))
+        testlog.set_verbosity(str(log.NONE), str(log.NONE))
+        self.assertFalse(testlog.is_logged(log.ERROR))
+
 
 if __name__ == "__main__":
     unittest.main()
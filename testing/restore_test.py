@@ -6,6 +6,7 @@ import os
 import unittest
 
 import commontest as comtst
+import fileset
 
 from rdiff_backup import log, rpath, Time
 from rdiffbackup.locations import _repo_shadow
@@ -199,6 +200,46 @@ class RestoreTest(unittest.TestCase):
         )
         self.assertTrue(os.lstat(self.out_dir))
 
+    def testRestoreManyEntries(self):
+        """Test restoring a directory large enough to be statted ahead"""
+        base_dir = os.path.join(TEST_BASE_DIR, b"restore_many")
+        entries = _repo_shadow._RestoreFile._STAT_POOL_MIN_ENTRIES + 36
+        from1_struct = {
+            "from1": {"contents": {"file{}": {"range": entries, "content": "initial"}}}
+        }
+        from2_struct = {
+            "from2": {"contents": {"file{}": {"range": entries, "content": "modified"}}}
+        }
+        from1_path = os.path.join(base_dir, b"from1")
+        from2_path = os.path.join(base_dir, b"from2")
+        bak_path = os.path.join(base_dir, b"bak")
+        fileset.create_fileset(base_dir, from1_struct)
+        fileset.create_fileset(base_dir, from2_struct)
+        comtst.remove_dir(bak_path)
+        comtst.InternalBackup(1, 1, from1_path, bak_path, 10000)
+        comtst.InternalBackup(1, 1, from2_path, bak_path, 20000)
+
+        # the stat-ahead keeps the order and creates the same rpaths
+        bak_rp = rpath.RPath(specifics.local_connection, bak_path)
+        filenames = sorted(os.listdir(from1_path))
+        self.assertEqual(
+            list(_repo_shadow._RestoreFile._yield_statted_ahead(bak_rp, filenames)),
+            list(map(bak_rp.append, filenames)),
+        )
+        _repo_shadow._RestoreFile.shutdown_stat_pool()
+        self.assertIsNone(_repo_shadow._RestoreFile._stat_pool)
+
+        comtst.remove_dir(self.out_dir)
+        comtst.InternalRestore(1, 1, bak_path, self.out_dir, 10000)
+        self.assertFalse(fileset.compare_paths(from1_path, self.out_dir))
+        comtst.remove_dir(self.out_dir)
+        comtst.InternalRestore(1, 1, bak_path, self.out_dir, 20000)
+        self.assertFalse(fileset.compare_paths(from2_path, self.out_dir))
+
+        fileset.remove_fileset(base_dir, from1_struct)
+        fileset.remove_fileset(base_dir, from2_struct)
+        comtst.remove_dir(bak_path)
+
 
 if __name__ == "__main__":
     unittest.main()
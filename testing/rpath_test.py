@@ -269,6 +269,7 @@ class TouchDelete(RPathTest):
         self.assertTrue(d.lstat())
         d.delete()
         self.assertFalse(d.lstat())
+        self.assertFalse(os.path.lexists(d.path))
 
 
 class MiscFileInfo(RPathTest):
@@ -83,6 +83,13 @@ class TimeTest(unittest.TestCase):
         # throw an exception (issue #295)
         self.assertIsNone(Time.bytestotime(b"\xff"))
 
+        # the same time string parsed again comes from the cache
+        hits = Time.bytestotime.cache_info().hits
+        self.assertEqual(
+            timesec, int(Time.bytestotime(Time.timetostring(timesec).encode("ascii")))
+        )
+        self.assertEqual(Time.bytestotime.cache_info().hits, hits + 1)
+
     def testStringtotime(self):
         """Test converting string to time"""
         timesec = int(time.time())